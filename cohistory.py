@@ -4,14 +4,47 @@ Codex Conversation History Viewer
 A simple CLI tool to browse Codex conversation history
 """
 
+import fcntl
+import functools
+import itertools
 import json
 import os
+import re
+import select
+import shutil
 import sys
 import termios
 import tty
-from datetime import datetime
+import unicodedata
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timezone
+from enum import IntEnum
+from operator import itemgetter
 from pathlib import Path
-from typing import Dict, List, Optional, Tuple
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Set,
+    Tuple,
+    Union,
+)
+
+# Faster JSON decoders are used when available; the standard library
+# remains the fallback so the script runs without extra packages.
+try:
+    import msgspec
+except ImportError:
+    msgspec = None
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 
 class Colors:
@@ -29,35 +62,251 @@ class Colors:
     END = "\033[0m"
 
 
+class BColors:
+    """ANSI color codes pre-encoded for byte-buffer output."""
+
+    BLUE = b"\033[94m"
+    GREEN = b"\033[92m"
+    YELLOW = b"\033[93m"
+    RED = b"\033[91m"
+    CYAN = b"\033[96m"
+    WHITE = b"\033[97m"
+    GRAY = b"\033[90m"
+    BOLD = b"\033[1m"
+    UNDERLINE = b"\033[4m"
+    END = b"\033[0m"
+
+
+SELECTED_PREFIX = BColors.GREEN + "▶ ".encode()
+
+COLOR_ROLE_HEADERS = {
+    "user": BColors.GREEN + BColors.BOLD + b"user:" + BColors.END + b"\n",
+    "assistant": BColors.BLUE + BColors.BOLD + b"assistant:" + BColors.END + b"\n",
+}
+PLAIN_ROLE_HEADERS = {"user": b"user:\n", "assistant": b"assistant:\n"}
+
 CODEX_DIR = Path.home() / ".codex" / "sessions"
 VERSION = "1.0.1"
 
+json_loads = orjson.loads if orjson is not None else json.loads
+
+if msgspec is not None:
+
+    class SessionMetaPayload(msgspec.Struct):
+        """Fields read from the ``session_meta`` payload."""
+
+        timestamp: Optional[str] = None
+        cwd: Optional[str] = None
+
+    class SessionMeta(msgspec.Struct):
+        """First line of a session file; other fields are skipped."""
+
+        type: str
+        payload: Optional[SessionMetaPayload] = None
+        timestamp: Optional[str] = None
+
+    class ResponsePayload(msgspec.Struct):
+        """Fields read from a ``response_item`` payload."""
+
+        type: Optional[str] = None
+        role: Optional[str] = None
+        content: Any = None
+
+    class ResponseItem(msgspec.Struct):
+        """A session line; other fields are skipped."""
+
+        type: str
+        payload: Optional[ResponsePayload] = None
+        timestamp: Any = ""
+
+    SESSION_META_DECODER = msgspec.json.Decoder(SessionMeta)
+    RESPONSE_ITEM_DECODER = msgspec.json.Decoder(ResponseItem)
+
+# The session header embeds the agent instructions, so it is read in chunks
+# up to the first newline rather than with a single fixed-size read.
+METADATA_CHUNK_SIZE = 8192
+METADATA_READ_LIMIT = 1 << 20
+METADATA_WORKERS = 16
+METADATA_PREFETCH_RADIUS = 2
+SESSIONS_PER_PAGE = 10
+# How often an idle menu with an on_highlight callback polls for updates.
+MENU_REFRESH_INTERVAL = 0.25
+
+CLEAR_SCREEN = b"\x1b[H\x1b[2J"
+
+# Escape sequence tails (after ESC) recognised by the menu.
+ESCAPE_TAILS = (b"[A", b"[B", b"[5~", b"[6~")
+
+
+class Action(IntEnum):
+    """Menu actions bound to keys."""
+
+    UP = 1
+    DOWN = 2
+    PAGE_UP = 3
+    PAGE_DOWN = 4
+    SELECT = 5
+    QUIT = 6
+
+
+KEY_ACTIONS = {
+    "\x1b[A": Action.UP,
+    "\x1b[B": Action.DOWN,
+    "\x1b[5~": Action.PAGE_UP,
+    "\x1b[6~": Action.PAGE_DOWN,
+    "\r": Action.SELECT,
+    "\n": Action.SELECT,
+    "q": Action.QUIT,
+    "\x03": Action.QUIT,  # Ctrl+C
+}
+
+
+ISO_TIMESTAMP_PATTERN = re.compile(
+    r"(\d{4})-(\d{2})-(\d{2})T(\d{2}):(\d{2}):(\d{2})(?:\.(\d{1,6})\d*)?(Z?)"
+)
+
+
+def write_bytes(data: Union[bytes, bytearray]) -> None:
+    """Write pre-encoded output in one call, after any pending text output."""
+    sys.stdout.flush()
+    sys.stdout.buffer.write(data)
+    sys.stdout.flush()
+
+
+def _line_rows(text: str, columns: int) -> int:
+    """Return how many terminal rows a line occupies once wrapped."""
+    width = sum(2 if unicodedata.east_asian_width(char) in "WF" else 1 for char in text)
+    return max(1, -(-width // max(columns, 1)))
+
 
 class InteractiveMenu:
     """Simple interactive menu using arrow keys."""
 
     def __init__(self) -> None:
         self.selected_index = 0
-
-    def get_key(self) -> str:
-        """Read a single keypress from stdin."""
+        self._saved_attrs: Optional[List] = None
+        self._pending = b""
+        self._drawn_size: Optional[os.terminal_size] = None
+        self._page_cache: Dict[int, List[Tuple[bytes, bytes]]] = {}
+        self._page_cache_items: Optional[List[str]] = None
+
+    def __enter__(self) -> "InteractiveMenu":
+        """Put stdin into raw mode until the context exits."""
         fd = sys.stdin.fileno()
-        old_settings = termios.tcgetattr(fd)
-        try:
-            tty.setraw(fd)
-            key = sys.stdin.read(1)
-
-            # Handle escape sequences (arrow keys, etc.)
-            if key == "\x1b":
-                key += sys.stdin.read(2)
+        self._saved_attrs = termios.tcgetattr(fd)
+        tty.setraw(fd)
+        # Keep output post-processing so "\n" still returns the carriage.
+        mode = termios.tcgetattr(fd)
+        mode[tty.OFLAG] = self._saved_attrs[tty.OFLAG]
+        termios.tcsetattr(fd, termios.TCSANOW, mode)
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        if self._saved_attrs is not None:
+            termios.tcsetattr(sys.stdin.fileno(), termios.TCSADRAIN, self._saved_attrs)
+            self._saved_attrs = None
+
+    def get_key(self, timeout: Optional[float] = None) -> Optional[str]:
+        """Read a single keypress from stdin.
+
+        Returns None if ``timeout`` seconds pass without a keypress.
+        """
+        if self._saved_attrs is None:
+            with self:
+                return self._read_key(timeout)
+        return self._read_key(timeout)
+
+    def _read_key(self, timeout: Optional[float]) -> Optional[str]:
+        fd = sys.stdin.fileno()
+        if not self._pending:
+            if timeout is not None and not select.select([fd], [], [], timeout)[0]:
+                return None
+            self._pending = os.read(fd, 32)
+        if self._pending == b"\x1b":
+            self._pending += self._drain(fd)
+
+        data = self._pending
+        if data[:1] == b"\x1b":
+            for tail in ESCAPE_TAILS:
+                if data.startswith(tail, 1):
+                    self._pending = data[1 + len(tail):]
+                    return "\x1b" + tail.decode()
+            # Unknown sequence: drop the rest of the read.
+            self._pending = b""
+            return data.decode("utf-8", "replace")
+
+        self._pending = data[1:]
+        return data[:1].decode("utf-8", "replace")
 
-            return key
+    @staticmethod
+    def _drain(fd: int) -> bytes:
+        """Read whatever follows a lone ESC without blocking."""
+        flags = fcntl.fcntl(fd, fcntl.F_GETFL)
+        fcntl.fcntl(fd, fcntl.F_SETFL, flags | os.O_NONBLOCK)
+        try:
+            return os.read(fd, 32)
+        except BlockingIOError:
+            return b""
         finally:
-            termios.tcsetattr(fd, termios.TCSADRAIN, old_settings)
+            fcntl.fcntl(fd, fcntl.F_SETFL, flags)
 
     def clear_screen(self) -> None:
         """Clear the terminal screen."""
-        os.system("clear")
+        write_bytes(CLEAR_SCREEN)
+
+    def _draw_page(
+        self,
+        buf: bytearray,
+        header: List[Tuple[bytes, str]],
+        items: List[str],
+        rows: List[Tuple[bytes, bytes]],
+        start_idx: int,
+    ) -> List[int]:
+        """Render a full menu page into ``buf`` and return each item's screen row.
+
+        An empty list is returned when the page does not fit on the screen, so
+        the caller redraws in full instead of addressing rows by position.
+        """
+        self._drawn_size = shutil.get_terminal_size()
+        columns, lines = self._drawn_size
+        buf += CLEAR_SCREEN
+        row = 1
+
+        for color, line in header:
+            if color:
+                buf += color + line.encode() + BColors.END + b"\n"
+            else:
+                buf += line.encode() + b"\n"
+            row += _line_rows(line, columns)
+
+        item_rows: List[int] = []
+        selected = self.selected_index - start_idx
+        for i, (normal, highlighted) in enumerate(rows):
+            buf += highlighted if i == selected else normal
+            item_rows.append(row)
+            row += _line_rows(f"  {items[start_idx + i]}", columns)
+
+        return item_rows if row <= lines else []
+
+    def _page_rows(
+        self, items: List[str], page: int, start_idx: int, end_idx: int
+    ) -> List[Tuple[bytes, bytes]]:
+        """Return the encoded (normal, highlighted) variants of a page's rows."""
+        if items is not self._page_cache_items:
+            self._page_cache = {}
+            self._page_cache_items = items
+
+        rows = self._page_cache.get(page)
+        if rows is None:
+            rows = [
+                (
+                    b"  " + encoded + b"\n",
+                    SELECTED_PREFIX + encoded + BColors.END + b"\n",
+                )
+                for encoded in (item.encode() for item in items[start_idx:end_idx])
+            ]
+            self._page_cache[page] = rows
+        return rows
 
     def display_menu(
         self,
@@ -65,8 +314,17 @@ class InteractiveMenu:
         title: str = "",
         paginate: bool = False,
         items_per_page: int = 10,
+        on_highlight: Optional[Callable[[int], Optional[bool]]] = None,
     ) -> int:
-        """Display an interactive menu and return the selected index."""
+        """Display an interactive menu and return the selected index.
+
+        ``on_highlight`` is called with the index whenever the selection moves.
+        It may relabel ``items`` in place and returns True to repaint the page,
+        False if nothing changed yet but updates are still expected, or None
+        once there is nothing left to wait for. Unless it returned None, it is
+        called again every ``MENU_REFRESH_INTERVAL`` seconds while no key is
+        pressed.
+        """
         self.selected_index = 0
         current_page = 0
         total_items = len(items)
@@ -78,68 +336,108 @@ class InteractiveMenu:
             total_pages = 1
             items_per_page = total_items if total_items > 0 else 1
 
-        while True:
-            self.clear_screen()
-
-            if title:
-                print(f"{Colors.BOLD}{Colors.CYAN}{title}{Colors.END}")
-                print("=" * len(title))
-                print()
-
-            if paginate:
-                print(
-                    f"{Colors.GRAY}Use ↑/↓ to navigate, PgUp/PgDn for pages, Enter to select, 'q' to quit{Colors.END}"
-                )
-                print(
-                    f"{Colors.YELLOW}Page {current_page + 1}/{total_pages} (Total: {total_items} items){Colors.END}"
-                )
-            else:
-                print(
-                    f"{Colors.GRAY}Use ↑/↓ to navigate, Enter to select, 'q' to quit{Colors.END}"
-                )
-            print()
-
-            start_idx = current_page * items_per_page
-            end_idx = min(start_idx + items_per_page, total_items)
-            visible_items = items[start_idx:end_idx]
+        prev_selected_index = -1
+        prev_page = -1
+        idle = False
+        polling = False
+        item_rows: List[int] = []
 
-            for i, item in enumerate(visible_items):
-                actual_index = start_idx + i
-                if actual_index == self.selected_index:
-                    print(f"{Colors.GREEN}▶ {item}{Colors.END}")
-                else:
-                    print(f"  {item}")
-
-            key = self.get_key()
-
-            if key == "\x1b[A":  # Up arrow
-                if self.selected_index > start_idx:
-                    self.selected_index -= 1
-                elif paginate and current_page > 0:
-                    current_page -= 1
-                    new_start = current_page * items_per_page
-                    new_end = min(new_start + items_per_page, total_items)
-                    self.selected_index = max(new_start, new_end - 1)
-            elif key == "\x1b[B":  # Down arrow
-                if self.selected_index < min(end_idx - 1, total_items - 1):
-                    self.selected_index += 1
-                elif paginate and current_page < total_pages - 1:
-                    current_page += 1
-                    self.selected_index = current_page * items_per_page
-            elif key == "\x1b[5~" and paginate:  # Page Up
-                if current_page > 0:
-                    current_page -= 1
-                    self.selected_index = current_page * items_per_page
-            elif key == "\x1b[6~" and paginate:  # Page Down
-                if current_page < total_pages - 1:
-                    current_page += 1
-                    self.selected_index = current_page * items_per_page
-            elif key in ("\r", "\n"):
-                return self.selected_index
-            elif key in ("q", "\x03"):  # q or Ctrl+C
-                self.clear_screen()
-                print("Goodbye!")
-                sys.exit(0)
+        with self:
+            while True:
+                start_idx = current_page * items_per_page
+                end_idx = min(start_idx + items_per_page, total_items)
+
+                if on_highlight is not None and (
+                    idle or self.selected_index != prev_selected_index
+                ):
+                    update = on_highlight(self.selected_index)
+                    polling = update is not None
+                    if update:
+                        # Labels changed in place; re-encode and repaint the page.
+                        self._page_cache = {}
+                        item_rows = []
+
+                rows = self._page_rows(items, current_page, start_idx, end_idx)
+
+                buf = bytearray()
+                if (
+                    current_page != prev_page
+                    or not item_rows
+                    or shutil.get_terminal_size() != self._drawn_size
+                ):
+                    header: List[Tuple[bytes, str]] = []
+                    if title:
+                        header.append((BColors.BOLD + BColors.CYAN, title))
+                        header.append((b"", "=" * len(title)))
+                        header.append((b"", ""))
+
+                    if paginate:
+                        header.append(
+                            (
+                                BColors.GRAY,
+                                "Use ↑/↓ to navigate, PgUp/PgDn for pages, Enter to select, 'q' to quit",
+                            )
+                        )
+                        header.append(
+                            (
+                                BColors.YELLOW,
+                                f"Page {current_page + 1}/{total_pages} (Total: {total_items} items)",
+                            )
+                        )
+                    else:
+                        header.append(
+                            (
+                                BColors.GRAY,
+                                "Use ↑/↓ to navigate, Enter to select, 'q' to quit",
+                            )
+                        )
+                    header.append((b"", ""))
+
+                    item_rows = self._draw_page(buf, header, items, rows, start_idx)
+                elif self.selected_index != prev_selected_index:
+                    old = prev_selected_index - start_idx
+                    new = self.selected_index - start_idx
+                    buf += b"\x1b[%d;1H\x1b[2K" % item_rows[old]
+                    buf += rows[old][0]
+                    buf += b"\x1b[%d;1H\x1b[2K" % item_rows[new]
+                    buf += rows[new][1]
+                if buf:
+                    write_bytes(buf)
+                prev_page = current_page
+                prev_selected_index = self.selected_index
+
+                key = self.get_key(MENU_REFRESH_INTERVAL if polling else None)
+                idle = key is None
+                action = KEY_ACTIONS.get(key) if key is not None else None
+
+                if action is Action.UP:
+                    if self.selected_index > start_idx:
+                        self.selected_index -= 1
+                    elif paginate and current_page > 0:
+                        current_page -= 1
+                        new_start = current_page * items_per_page
+                        new_end = min(new_start + items_per_page, total_items)
+                        self.selected_index = max(new_start, new_end - 1)
+                elif action is Action.DOWN:
+                    if self.selected_index < min(end_idx - 1, total_items - 1):
+                        self.selected_index += 1
+                    elif paginate and current_page < total_pages - 1:
+                        current_page += 1
+                        self.selected_index = current_page * items_per_page
+                elif action is Action.PAGE_UP and paginate:
+                    if current_page > 0:
+                        current_page -= 1
+                        self.selected_index = current_page * items_per_page
+                elif action is Action.PAGE_DOWN and paginate:
+                    if current_page < total_pages - 1:
+                        current_page += 1
+                        self.selected_index = current_page * items_per_page
+                elif action is Action.SELECT:
+                    return self.selected_index
+                elif action is Action.QUIT:
+                    self.clear_screen()
+                    print("Goodbye!")
+                    sys.exit(0)
 
 
 class CodexHistoryViewer:
@@ -148,6 +446,18 @@ class CodexHistoryViewer:
     def __init__(self) -> None:
         self.menu = InteractiveMenu()
         self.sessions_dir = CODEX_DIR
+        # Session counts per day directory, keyed by path and invalidated by
+        # that directory's own mtime.
+        self._day_counts_cache: Dict[str, Tuple[int, int]] = {}
+        # The most recent listing of each day, used by highlight_session.
+        self._session_files: Dict[Path, List[Tuple[Path, os.stat_result]]] = {}
+        # Session headers keyed by (path, mtime_ns, size), filled by workers.
+        # Only the latest key of each path is kept; see _refresh_metadata_key.
+        self._metadata_cache: Dict[Tuple[Path, int, int], Dict[str, Optional[str]]] = {}
+        self._metadata_keys: Dict[Path, Tuple[Path, int, int]] = {}
+        # Keys whose header read is in flight.
+        self._metadata_requested: Set[Tuple[Path, int, int]] = set()
+        self._metadata_executor: Optional[ThreadPoolExecutor] = None
 
         if not self.sessions_dir.exists():
             print(
@@ -159,6 +469,25 @@ class CodexHistoryViewer:
     def _parse_iso_timestamp(timestamp: Optional[str]) -> Optional[datetime]:
         if not timestamp:
             return None
+
+        # Codex writes UTC timestamps like 2025-01-02T03:04:05.678Z.
+        match = ISO_TIMESTAMP_PATTERN.fullmatch(timestamp)
+        if match:
+            year, month, day, hour, minute, second, fraction, zulu = match.groups()
+            try:
+                return datetime(
+                    int(year),
+                    int(month),
+                    int(day),
+                    int(hour),
+                    int(minute),
+                    int(second),
+                    int(fraction.ljust(6, "0")) if fraction else 0,
+                    timezone.utc if zulu else None,
+                )
+            except ValueError:
+                return None
+
         try:
             if timestamp.endswith("Z"):
                 timestamp = timestamp[:-1] + "+00:00"
@@ -166,189 +495,351 @@ class CodexHistoryViewer:
         except Exception:
             return None
 
-    def get_dates(self) -> List[Tuple[str, Path]]:
-        """Collect available dates (year/month/day) with session files."""
-        date_entries: List[Tuple[str, Path, datetime]] = []
+    @staticmethod
+    def _scan_numeric_dirs(path: Union[str, Path]) -> Iterator[Tuple[int, os.DirEntry]]:
+        """Yield subdirectories with numeric names (year, month or day)."""
+        with os.scandir(path) as entries:
+            for entry in entries:
+                # isdecimal() rejects dotfiles and other names without raising;
+                # unlike isdigit() it only accepts characters int() can parse.
+                if not entry.name.isdecimal() or not entry.is_dir():
+                    continue
+                yield int(entry.name), entry
 
-        for year_dir in self.sessions_dir.iterdir():
-            if not year_dir.is_dir():
-                continue
-            try:
-                year = int(year_dir.name)
-            except ValueError:
-                continue
+    @staticmethod
+    def _scan_session_files(day_path: Union[str, Path]) -> List[os.DirEntry]:
+        """List the visible ``*.jsonl`` files of a day directory."""
+        with os.scandir(day_path) as entries:
+            return [
+                entry
+                for entry in entries
+                if entry.name.endswith(".jsonl")
+                and not entry.name.startswith(".")
+                and entry.is_file()
+            ]
 
-            for month_dir in year_dir.iterdir():
-                if not month_dir.is_dir():
-                    continue
-                try:
-                    month = int(month_dir.name)
-                except ValueError:
-                    continue
+    def get_dates(self) -> List[Tuple[str, Path]]:
+        """Collect available dates (year/month/day) with session files.
 
-                for day_dir in month_dir.iterdir():
-                    if not day_dir.is_dir():
-                        continue
-                    try:
-                        day = int(day_dir.name)
-                    except ValueError:
-                        continue
+        The year and month levels are always rescanned; a day's session count
+        is reused until that day directory's mtime changes.
+        """
+        date_entries: List[Tuple[str, Path, datetime]] = []
 
-                    session_files = [
-                        file_path
-                        for file_path in day_dir.glob("*.jsonl")
-                        if file_path.is_file() and not file_path.name.startswith(".")
-                    ]
-                    if not session_files:
+        for year, year_entry in self._scan_numeric_dirs(self.sessions_dir):
+            for month, month_entry in self._scan_numeric_dirs(year_entry.path):
+                for day, day_entry in self._scan_numeric_dirs(month_entry.path):
+                    count = self._count_sessions(day_entry)
+                    if not count:
                         continue
 
                     date_value = datetime(year=year, month=month, day=day)
-                    count = len(session_files)
                     label = (
                         f"{date_value.strftime('%Y-%m-%d')} "
                         f"({count} {'session' if count == 1 else 'sessions'})"
                     )
-                    date_entries.append((label, day_dir, date_value))
+                    date_entries.append((label, Path(day_entry.path), date_value))
 
-        date_entries.sort(key=lambda item: item[2], reverse=True)
+        date_entries.sort(key=itemgetter(2), reverse=True)
         return [(label, path) for label, path, _ in date_entries]
 
-    def get_sessions(self, day_path: Path) -> List[Tuple[str, Path]]:
-        """List session files for a given day."""
-        session_entries: List[Tuple[str, Path, datetime]] = []
-
-        for jsonl_file in day_path.glob("*.jsonl"):
-            if not jsonl_file.is_file() or jsonl_file.name.startswith("."):
-                continue
-
-            metadata = self._read_session_metadata(jsonl_file)
-            started_at = metadata.get("timestamp")
-            started_dt = (
-                self._parse_iso_timestamp(started_at)
-                if isinstance(started_at, str)
-                else None
-            )
-            if not started_dt:
-                started_dt = datetime.fromtimestamp(jsonl_file.stat().st_mtime)
+    def _count_sessions(self, day_entry: os.DirEntry) -> int:
+        mtime_ns = day_entry.stat().st_mtime_ns
+        cached = self._day_counts_cache.get(day_entry.path)
+        if cached is not None and cached[0] == mtime_ns:
+            return cached[1]
+
+        count = len(self._scan_session_files(day_entry.path))
+        self._day_counts_cache[day_entry.path] = (mtime_ns, count)
+        return count
 
-            cwd = metadata.get("cwd")
-            cwd_label = f" - {Path(cwd).name}" if cwd else ""
-            display_name = f"{started_dt.strftime('%H:%M')} - {jsonl_file.name}{cwd_label}"
-            session_entries.append((display_name, jsonl_file, started_dt))
+    def get_sessions(self, day_path: Path) -> List[Tuple[str, Path]]:
+        """List session files for a given day, most recently modified first.
+
+        The directory is rescanned on every call so the file still being
+        written is re-sorted with its current mtime. Labels only use metadata
+        that is already cached; the rest is loaded in the background through
+        :meth:`highlight_session`.
+        """
+        files = [
+            (Path(entry.path), entry.stat())
+            for entry in self._scan_session_files(day_path)
+        ]
+        files.sort(key=lambda item: item[1].st_mtime, reverse=True)
+        self._session_files[day_path] = files
+        for path, file_stat in files:
+            self._refresh_metadata_key(path, file_stat)
+
+        return [
+            (self._session_label(path, file_stat), path) for path, file_stat in files
+        ]
+
+    def highlight_session(
+        self, day_path: Path, menu_items: List[str], index: int
+    ) -> Optional[bool]:
+        """Prefetch metadata for the visible page around a highlighted row.
+
+        ``menu_items`` is the session menu, whose first row is the back entry.
+        Rows on the page of ``index``, plus a few beyond it, are loaded in the
+        background; those whose metadata has arrived are relabelled in place.
+        Returns True if any label changed, False if reads are still in flight,
+        and None once every row in range is loaded.
+        """
+        files = self._session_files[day_path]
+        page_start = index - index % SESSIONS_PER_PAGE
+        first_row = min(page_start, index - METADATA_PREFETCH_RADIUS)
+        last_row = max(
+            page_start + SESSIONS_PER_PAGE, index + METADATA_PREFETCH_RADIUS + 1
+        )
+        # Menu rows are offset by one from session positions.
+        first = max(first_row - 1, 0)
+        last = min(last_row - 1, len(files))
+        changed = False
+        pending = False
+
+        for position in range(first, last):
+            path, file_stat = files[position]
+            key = (path, file_stat.st_mtime_ns, file_stat.st_size)
+            if key in self._metadata_cache:
+                label = self._session_label(path, file_stat)
+                if menu_items[position + 1] != label:
+                    menu_items[position + 1] = label
+                    changed = True
+            else:
+                pending = True
+                if key not in self._metadata_requested:
+                    self._metadata_requested.add(key)
+                    if self._metadata_executor is None:
+                        self._metadata_executor = ThreadPoolExecutor(
+                            max_workers=METADATA_WORKERS
+                        )
+                    self._metadata_executor.submit(self._load_session_metadata, key)
+
+        if changed:
+            return True
+        return False if pending else None
+
+    def _refresh_metadata_key(self, path: Path, file_stat: os.stat_result) -> None:
+        """Record a path's current cache key and drop the entries for its old one."""
+        key = (path, file_stat.st_mtime_ns, file_stat.st_size)
+        old_key = self._metadata_keys.get(path)
+        if old_key == key:
+            return
+
+        self._metadata_keys[path] = key
+        if old_key is None:
+            return
+        self._metadata_requested.discard(old_key)
+        metadata = self._metadata_cache.pop(old_key, None)
+        # Session files are append-only, so a file that only grew keeps its
+        # header and needs no second read.
+        if metadata is not None and file_stat.st_size >= old_key[2]:
+            self._metadata_cache[key] = metadata
+
+    def _load_session_metadata(self, key: Tuple[Path, int, int]) -> None:
+        metadata = self._read_session_metadata(key[0])
+        # Skip the result if the file changed while it was being read.
+        if self._metadata_keys.get(key[0]) == key:
+            self._metadata_cache[key] = metadata
+        self._metadata_requested.discard(key)
+
+    def _session_label(self, jsonl_file: Path, file_stat: os.stat_result) -> str:
+        """Label a session by its start time and cwd once metadata is loaded.
+
+        Until then the file's mtime stands in for the start time. Both are
+        shown in local time.
+        """
+        metadata = self._metadata_cache.get(
+            (jsonl_file, file_stat.st_mtime_ns, file_stat.st_size)
+        )
+        if metadata is None:
+            modified = datetime.fromtimestamp(file_stat.st_mtime)
+            return f"{modified.strftime('%H:%M')} - {jsonl_file.name}"
+
+        started_at = metadata.get("timestamp")
+        started_dt = (
+            self._parse_iso_timestamp(started_at)
+            if isinstance(started_at, str)
+            else None
+        )
+        if started_dt:
+            started_dt = started_dt.astimezone()
+        else:
+            started_dt = datetime.fromtimestamp(file_stat.st_mtime)
 
-        session_entries.sort(key=lambda item: item[2], reverse=True)
-        return [(label, path) for label, path, _ in session_entries]
+        cwd = metadata.get("cwd")
+        cwd_label = f" - {Path(cwd).name}" if cwd else ""
+        return f"{started_dt.strftime('%H:%M')} - {jsonl_file.name}{cwd_label}"
 
     @staticmethod
     def _read_session_metadata(jsonl_path: Path) -> Dict[str, Optional[str]]:
-        """Read the first line to extract metadata such as timestamp and cwd."""
+        """Read the first line to extract the session's start timestamp and cwd."""
         try:
-            with open(jsonl_path, "r", encoding="utf-8") as file:
-                first_line = file.readline()
-                if not first_line.strip():
-                    return {}
-                data = json.loads(first_line)
-                if data.get("type") != "session_meta":
+            fd = os.open(jsonl_path, os.O_RDONLY)
+            try:
+                chunks: List[bytes] = []
+                size = 0
+                while size < METADATA_READ_LIMIT:
+                    chunk = os.read(fd, METADATA_CHUNK_SIZE)
+                    if not chunk:
+                        break
+                    chunks.append(chunk)
+                    size += len(chunk)
+                    if b"\n" in chunk:
+                        break
+            finally:
+                os.close(fd)
+
+            first_line = b"".join(chunks).partition(b"\n")[0]
+            if not first_line.strip():
+                return {}
+            if msgspec is not None:
+                meta = SESSION_META_DECODER.decode(first_line)
+                if meta.type != "session_meta":
                     return {}
-                payload = data.get("payload", {})
+                payload = meta.payload or SessionMetaPayload()
                 return {
-                    "timestamp": payload.get("timestamp") or data.get("timestamp"),
-                    "cwd": payload.get("cwd"),
-                    "originator": payload.get("originator"),
+                    "timestamp": payload.timestamp or meta.timestamp,
+                    "cwd": payload.cwd,
                 }
+            data = json_loads(first_line)
+            if data.get("type") != "session_meta":
+                return {}
+            payload = data.get("payload", {})
+            return {
+                "timestamp": payload.get("timestamp") or data.get("timestamp"),
+                "cwd": payload.get("cwd"),
+            }
         except Exception:
             return {}
 
     @staticmethod
     def _extract_text(content: object) -> str:
         """Extract textual content from Codex payload entries."""
-        parts: List[str] = []
-
         if isinstance(content, str):
-            parts.append(content)
-        elif isinstance(content, list):
-            for item in content:
-                if isinstance(item, dict):
-                    item_type = item.get("type")
-                    if item_type in {"input_text", "output_text", "text"}:
-                        text = item.get("text")
-                        if text:
-                            parts.append(text)
-                elif isinstance(item, str):
-                    parts.append(item)
-
-        return "\n".join(part for part in parts if part).strip()
-
-    def parse_conversation(self, jsonl_path: Path) -> List[Dict[str, str]]:
-        """Parse a session JSONL file and extract user/assistant messages."""
-        messages: List[Dict[str, str]] = []
+            return content.strip()
+        if not isinstance(content, list):
+            return ""
 
-        try:
-            with open(jsonl_path, "r", encoding="utf-8") as file:
-                for line in file:
-                    if not line.strip():
-                        continue
+        parts: List[str] = []
+        for item in content:
+            if isinstance(item, dict):
+                item_type = item.get("type")
+                if (
+                    item_type == "input_text"
+                    or item_type == "output_text"
+                    or item_type == "text"
+                ):
+                    text = item.get("text")
+                    if text:
+                        parts.append(text)
+            elif isinstance(item, str) and item:
+                parts.append(item)
+
+        return "\n".join(parts).strip()
 
-                    try:
-                        data = json.loads(line)
-                    except json.JSONDecodeError:
-                        continue
+    @staticmethod
+    def _decode_message(line: Union[str, bytes]) -> Optional[Tuple[str, Any, Any]]:
+        """Decode a user/assistant message line into (role, content, timestamp)."""
+        if msgspec is not None:
+            try:
+                item = RESPONSE_ITEM_DECODER.decode(line)
+            except (msgspec.DecodeError, UnicodeDecodeError):
+                return None
+            payload = item.payload
+            if item.type != "response_item" or payload is None:
+                return None
+            if payload.type != "message" or payload.role not in {"user", "assistant"}:
+                return None
+            return payload.role, payload.content, item.timestamp
 
-                    if data.get("type") != "response_item":
-                        continue
+        try:
+            data = json_loads(line)
+        except ValueError:
+            return None
 
-                    payload = data.get("payload", {})
-                    if not isinstance(payload, dict):
-                        continue
+        if not isinstance(data, dict) or data.get("type") != "response_item":
+            return None
 
-                    if payload.get("type") != "message":
-                        continue
+        payload = data.get("payload", {})
+        if not isinstance(payload, dict):
+            return None
 
-                    role = payload.get("role")
-                    if role not in {"user", "assistant"}:
-                        continue
+        if payload.get("type") != "message":
+            return None
 
-                    text = self._extract_text(payload.get("content"))
-                    if not text:
-                        continue
+        role = payload.get("role")
+        if role not in {"user", "assistant"}:
+            return None
 
-                    messages.append(
-                        {
-                            "role": role,
-                            "content": text,
-                            "timestamp": data.get("timestamp", ""),
-                        }
-                    )
-        except Exception as error:
-            print(f"{Colors.RED}Error reading file: {error}{Colors.END}")
-            return []
+        return role, payload.get("content"), data.get("timestamp", "")
 
-        return messages
+    def parse_conversation(self, jsonl_path: Path) -> Iterator[Tuple[str, str, Any]]:
+        """Yield (role, text, timestamp) for each user/assistant message.
 
-    def display_conversation(self, messages: List[Dict[str, str]], day_label: str, file_name: str) -> None:
-        """Display the conversation content in the terminal."""
-        self.menu.clear_screen()
+        Read errors propagate to the caller, which reports them on screen.
+        """
+        with open(jsonl_path, "rb") as file:
+            for line in file:
+                # Cheap substring test: most lines are tool calls and
+                # events that would be decoded only to be discarded.
+                if b'"response_item"' not in line or b'"message"' not in line:
+                    continue
 
-        print(f"{Colors.BOLD}{Colors.CYAN}Date: {day_label}{Colors.END}")
-        print(f"{Colors.BOLD}{Colors.CYAN}Session: {file_name}{Colors.END}")
-        print("=" * 80)
-        print()
+                message = self._decode_message(line)
+                if message is None:
+                    continue
 
-        for message in messages:
-            role = message["role"]
-            content = message["content"]
+                role, content, timestamp = message
+                text = self._extract_text(content)
+                if not text:
+                    continue
 
-            if role == "user":
-                print(f"{Colors.GREEN}{Colors.BOLD}user:{Colors.END}")
-            elif role == "assistant":
-                print(f"{Colors.BLUE}{Colors.BOLD}assistant:{Colors.END}")
-            else:
-                print(f"{Colors.WHITE}{Colors.BOLD}{role}:{Colors.END}")
+                yield role, text, timestamp
 
-            print(content)
-            print()
+    def display_conversation(
+        self, messages: Iterable[Tuple[str, str, Any]], day_label: str, file_name: str
+    ) -> None:
+        """Display the conversation content in the terminal."""
+        color = sys.stdout.isatty()
+        buf = bytearray()
+
+        date_line = b"Date: " + day_label.encode()
+        session_line = b"Session: " + file_name.encode()
+        if color:
+            buf += CLEAR_SCREEN
+            buf += BColors.BOLD + BColors.CYAN + date_line + BColors.END + b"\n"
+            buf += BColors.BOLD + BColors.CYAN + session_line + BColors.END + b"\n"
+        else:
+            buf += date_line + b"\n" + session_line + b"\n"
+        buf += b"=" * 80 + b"\n\n"
 
-        print(f"{Colors.GRAY}Press any key to return to the menu...{Colors.END}")
+        role_headers = COLOR_ROLE_HEADERS if color else PLAIN_ROLE_HEADERS
+        try:
+            for role, content, _ in messages:
+                header = role_headers.get(role)
+                if header is None:
+                    name = role.encode() + b":"
+                    if color:
+                        name = BColors.WHITE + BColors.BOLD + name + BColors.END
+                    header = name + b"\n"
+
+                buf += header
+                buf += content.encode("utf-8", "replace")
+                buf += b"\n\n"
+        except Exception as error:
+            # The transcript is incomplete; say so above the prompt.
+            notice = f"Error reading file: {error}".encode("utf-8", "replace")
+            if color:
+                notice = BColors.RED + notice + BColors.END
+            buf += notice + b"\n\n"
+
+        prompt = b"Press any key to return to the menu..."
+        if color:
+            buf += BColors.GRAY + prompt + BColors.END + b"\n"
+        else:
+            buf += prompt + b"\n"
+        write_bytes(buf)
         self.menu.get_key()
 
     def run(self) -> None:
@@ -385,12 +876,15 @@ class CodexHistoryViewer:
 
                 session_labels = [label for label, _ in sessions]
                 menu_items = ["< Back to Dates"] + session_labels
-                paginate_sessions = len(menu_items) > 10
+                paginate_sessions = len(menu_items) > SESSIONS_PER_PAGE
                 selected_session_idx = self.menu.display_menu(
                     menu_items,
                     f"Select a Session from {day_label}",
                     paginate=paginate_sessions,
-                    items_per_page=10,
+                    items_per_page=SESSIONS_PER_PAGE,
+                    on_highlight=functools.partial(
+                        self.highlight_session, day_path, menu_items
+                    ),
                 )
 
                 if selected_session_idx == 0:
@@ -398,9 +892,21 @@ class CodexHistoryViewer:
 
                 session_path = sessions[selected_session_idx - 1][1]
                 messages = self.parse_conversation(session_path)
+                try:
+                    first_message = next(messages, None)
+                except Exception as error:
+                    self.menu.clear_screen()
+                    print(f"{Colors.RED}Error reading file: {error}{Colors.END}")
+                    print(f"{Colors.GRAY}Press any key to continue...{Colors.END}")
+                    self.menu.get_key()
+                    continue
 
-                if messages:
-                    self.display_conversation(messages, day_label, session_path.name)
+                if first_message is not None:
+                    self.display_conversation(
+                        itertools.chain((first_message,), messages),
+                        day_label,
+                        session_path.name,
+                    )
                 else:
                     self.menu.clear_screen()
                     print(